@@ -1,3 +1,62 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import ClientBeneficiary, ClientPlan, ClientPlanMeta, ClientPlanStatusHistory, Personnel, PlanPayment
+
+
+@admin.register(Personnel)
+class PersonnelAdmin(admin.ModelAdmin):
+    list_display = ("full_name", "parent_personnel", "is_agent", "is_collector", "is_employee", "is_active")
+    list_select_related = ("parent_personnel",)
+    raw_id_fields = ("parent_personnel",)
+    search_fields = ("full_name",)
+
+
+@admin.register(PlanPayment)
+class PlanPaymentAdmin(admin.ModelAdmin):
+    list_display = ("plan", "period", "amount")
+    list_select_related = ("plan", "period")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("plan", "period")
+
+
+class ClientPlanMetaInline(admin.StackedInline):
+    model = ClientPlanMeta
+    fields = ("contestability_months", "months_paid_continuously", "is_contestable")
+    readonly_fields = ("is_contestable",)
+    can_delete = False
+
+
+class ClientPlanStatusHistoryInline(admin.TabularInline):
+    model = ClientPlanStatusHistory
+    fields = ("changed_at", "old_status", "new_status")
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ClientPlan)
+class ClientPlanAdmin(admin.ModelAdmin):
+    list_display = ("contract_no", "client", "plan", "status")
+    inlines = (ClientPlanMetaInline, ClientPlanStatusHistoryInline)
+    list_select_related = ("client", "plan")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("client", "plan")
+
+
+@admin.register(ClientBeneficiary)
+class ClientBeneficiaryAdmin(admin.ModelAdmin):
+    list_display = ("full_name", "client_plan", "is_primary", "is_active")
+    list_select_related = ("client_plan__plan",)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("client_plan__plan")
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == "client_plan":
+            kwargs["queryset"] = ClientPlan.objects.for_display()
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from main.triggers import install_triggers
+
+
+class Command(BaseCommand):
+    help = "Create or replace the database triggers that record client plan status history."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Database to install the triggers on. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if not install_triggers(connection):
+            raise CommandError(
+                f"Could not install history triggers on {connection.vendor!r}; "
+                "check the backend is supported and migrations have been applied."
+            )
+        self.stdout.write(self.style.SUCCESS("History triggers installed."))
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:13
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0002_clientbeneficiary_plan_active_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='plan',
+            name='allowance',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='commission',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='contract_price',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='production',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='rate',
+            field=models.DecimalField(decimal_places=4, default=Decimal('0.0000'), max_digits=9),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_plan_decimal_amounts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='client_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientbeneficiary',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='client_benef_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientplan',
+            index=models.Index(fields=['status', 'client'], name='client_plan_status_client_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='personnel_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(condition=models.Q(('is_agent', True)), fields=['is_agent'], name='personnel_agent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(condition=models.Q(('is_collector', True)), fields=['is_collector'], name='personnel_collector_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clientplan',
+            name='is_contestable',
+            field=models.GeneratedField(db_persist=True, expression=models.Q(('months_paid_continuously__lt', models.F('contestability_months'))), output_field=models.BooleanField()),
+        ),
+    ]
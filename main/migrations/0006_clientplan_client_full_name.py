@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:17
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_client_full_name(apps, schema_editor):
+    Client = apps.get_model('main', 'Client')
+    ClientPlan = apps.get_model('main', 'ClientPlan')
+    ClientPlan.objects.update(
+        client_full_name=Subquery(
+            Client.objects.filter(pk=OuterRef('client_id')).values('full_name')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_clientplan_is_contestable_generated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clientplan',
+            name='client_full_name',
+            field=models.CharField(blank=True, editable=False, max_length=150),
+        ),
+        migrations.RunPython(backfill_client_full_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:17
+
+import django.db.models.deletion
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+def drop_status_triggers(apps, schema_editor):
+    # The triggers in main.triggers insert into this table, so they must go
+    # before the table does. They are installed after migrate, not here.
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        plan_table = schema_editor.quote_name(apps.get_model('main', 'ClientPlan')._meta.db_table)
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS client_plan_status_history_trg ON {plan_table}')
+        schema_editor.execute('DROP FUNCTION IF EXISTS client_plan_status_history_trg_fn()')
+    elif connection.vendor in ('sqlite', 'mysql'):
+        schema_editor.execute('DROP TRIGGER IF EXISTS client_plan_status_history_trg')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_clientplan_client_full_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClientPlanStatusHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('old_status', models.CharField(choices=[('active', 'Active'), ('lapsed', 'Lapsed'), ('reinstated', 'Reinstated'), ('transferred', 'Transferred'), ('assigned', 'Assigned'), ('cancelled', 'Cancelled'), ('completed', 'Completed')], max_length=20)),
+                ('new_status', models.CharField(choices=[('active', 'Active'), ('lapsed', 'Lapsed'), ('reinstated', 'Reinstated'), ('transferred', 'Transferred'), ('assigned', 'Assigned'), ('cancelled', 'Cancelled'), ('completed', 'Completed')], max_length=20)),
+                ('changed_at', models.DateTimeField(db_default=django.db.models.functions.datetime.Now())),
+                ('client_plan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_history', to='main.clientplan')),
+            ],
+            options={
+                'verbose_name': 'Client Plan Status History',
+                'verbose_name_plural': 'Client Plan Status History',
+                'db_table': 'client_plan_status_history',
+                'ordering': ['changed_at'],
+            },
+        ),
+        migrations.RunPython(migrations.RunPython.noop, drop_status_triggers),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_personnel_path(apps, schema_editor):
+    Personnel = apps.get_model('main', 'Personnel')
+    parents = dict(Personnel.objects.values_list('pk', 'parent_personnel_id'))
+    max_length = Personnel._meta.get_field('path').max_length
+    paths = {}
+
+    for pk in parents:
+        # Walk up to the first node with a known path (or a root), then
+        # build the paths back down, without recursion.
+        chain = []
+        node = pk
+        while node is not None and node not in paths:
+            if node in chain:
+                cycle = chain[chain.index(node):]
+                raise ValueError(
+                    f'Cannot build personnel paths: parent_personnel forms a cycle through ids {cycle}. '
+                    'Fix parent_personnel on one of them and migrate again.'
+                )
+            chain.append(node)
+            node = parents[node]
+        path = paths[node] if node is not None else '/'
+        for node in reversed(chain):
+            path = f'{path}{node}/'
+            if len(path) > max_length:
+                raise ValueError(f'Cannot build personnel paths: the path of id {node} exceeds {max_length} characters.')
+            paths[node] = path
+
+    people = list(Personnel.objects.only('pk'))
+    for person in people:
+        person.path = paths[person.pk]
+    Personnel.objects.bulk_update(people, ['path'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_clientplan_status_history'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='personnel',
+            name='path',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_personnel_path, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(fields=['full_name'], name='personnel_full_name_idx'),
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:18
+
+from django.db import migrations, models
+from django.db.models.functions import Length
+
+MAX_LENGTH = 500
+
+COLUMNS = [
+    ('branch', 'address'),
+    ('client', 'address'),
+    ('clientplanlapse', 'reason'),
+    ('clientplanreinstatement', 'remarks'),
+    ('clientplantransfer', 'reason'),
+    ('company', 'address'),
+    ('period', 'description'),
+    ('personnel', 'address'),
+    ('plan', 'description'),
+]
+
+
+def check_lengths(apps, schema_editor):
+    # Narrowing the columns would abort half way on PostgreSQL and strict
+    # MySQL, or silently truncate on non-strict MySQL; refuse up front.
+    too_long = []
+    for model_name, field in COLUMNS:
+        model = apps.get_model('main', model_name)
+        pks = list(
+            model.objects.annotate(_length=Length(field)).filter(_length__gt=MAX_LENGTH).values_list('pk', flat=True)
+        )
+        if pks:
+            too_long.append(f'{model._meta.db_table}.{field} (ids {pks})')
+    if too_long:
+        raise ValueError(
+            f'Cannot shorten text columns to {MAX_LENGTH} characters, longer values found in: '
+            + ', '.join(too_long)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_personnel_path'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_lengths, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='branch',
+            name='address',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='address',
+            field=models.CharField(max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='clientplanlapse',
+            name='reason',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='clientplanreinstatement',
+            name='remarks',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='clientplantransfer',
+            name='reason',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='company',
+            name='address',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='period',
+            name='description',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='personnel',
+            name='address',
+            field=models.CharField(max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='description',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:18
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_short_text_as_charfield'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='client',
+            name='age',
+        ),
+        migrations.RemoveField(
+            model_name='clientbeneficiary',
+            name='age',
+        ),
+    ]
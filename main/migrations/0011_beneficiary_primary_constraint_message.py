@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0010_drop_stored_age'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterConstraint(
+            model_name='clientbeneficiary',
+            name='unique_active_primary_per_client_plan',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True), ('is_primary', True)), fields=('client_plan', 'is_primary', 'is_active'), name='unique_active_primary_per_client_plan', violation_error_message='There can only be one active primary beneficiary for a Client Plan.'),
+        ),
+    ]
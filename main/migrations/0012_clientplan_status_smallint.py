@@ -0,0 +1,158 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:20
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+STATUS_CODES = {
+    'active': 1,
+    'lapsed': 2,
+    'reinstated': 3,
+    'transferred': 4,
+    'assigned': 5,
+    'cancelled': 6,
+    'completed': 7,
+}
+
+STATUS_CHOICES = [
+    (1, 'Active'),
+    (2, 'Lapsed'),
+    (3, 'Reinstated'),
+    (4, 'Transferred'),
+    (5, 'Assigned'),
+    (6, 'Cancelled'),
+    (7, 'Completed'),
+]
+
+
+def remove_status_triggers(apps, schema_editor):
+    # The status history triggers read the columns rewritten here. They are
+    # installed again after migrate (see main.triggers).
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        plan_table = schema_editor.quote_name(apps.get_model('main', 'ClientPlan')._meta.db_table)
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS client_plan_status_history_trg ON {plan_table}')
+        schema_editor.execute('DROP FUNCTION IF EXISTS client_plan_status_history_trg_fn()')
+    elif connection.vendor in ('sqlite', 'mysql'):
+        schema_editor.execute('DROP TRIGGER IF EXISTS client_plan_status_history_trg')
+
+
+def _convert(model, mapping, **columns):
+    for source in columns.values():
+        unknown = set(model.objects.exclude(**{f'{source}__in': list(mapping)}).values_list(source, flat=True))
+        if unknown:
+            raise ValueError(
+                f'Cannot convert {model._meta.db_table}.{source}: unknown values {sorted(unknown, key=str)}'
+            )
+    model.objects.update(**{
+        target: Case(*[When(**{source: old}, then=Value(new)) for old, new in mapping.items()])
+        for target, source in columns.items()
+    })
+
+
+def status_to_code(apps, schema_editor):
+    _convert(apps.get_model('main', 'ClientPlan'), STATUS_CODES, status_code='status')
+    _convert(
+        apps.get_model('main', 'ClientPlanStatusHistory'), STATUS_CODES,
+        old_status_code='old_status', new_status_code='new_status',
+    )
+
+
+def code_to_status(apps, schema_editor):
+    names = {code: name for name, code in STATUS_CODES.items()}
+    _convert(apps.get_model('main', 'ClientPlan'), names, status='status_code')
+    _convert(
+        apps.get_model('main', 'ClientPlanStatusHistory'), names,
+        old_status='old_status_code', new_status='new_status_code',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0011_beneficiary_primary_constraint_message'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_status_triggers, remove_status_triggers),
+        migrations.RemoveIndex(
+            model_name='clientplan',
+            name='client_plan_status_client_idx',
+        ),
+        migrations.AddField(
+            model_name='clientplan',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='clientplanstatushistory',
+            name='old_status_code',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='clientplanstatushistory',
+            name='new_status_code',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.RunPython(status_to_code, code_to_status),
+        # A default lets the old columns be re-added to existing rows when
+        # this migration is unapplied.
+        migrations.AlterField(
+            model_name='clientplanstatushistory',
+            name='old_status',
+            field=models.CharField(default='active', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='clientplanstatushistory',
+            name='new_status',
+            field=models.CharField(default='active', max_length=20),
+        ),
+        migrations.RemoveField(
+            model_name='clientplan',
+            name='status',
+        ),
+        migrations.RemoveField(
+            model_name='clientplanstatushistory',
+            name='old_status',
+        ),
+        migrations.RemoveField(
+            model_name='clientplanstatushistory',
+            name='new_status',
+        ),
+        migrations.RenameField(
+            model_name='clientplan',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RenameField(
+            model_name='clientplanstatushistory',
+            old_name='old_status_code',
+            new_name='old_status',
+        ),
+        migrations.RenameField(
+            model_name='clientplanstatushistory',
+            old_name='new_status_code',
+            new_name='new_status',
+        ),
+        migrations.AlterField(
+            model_name='clientplan',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=STATUS_CHOICES, default=1),
+        ),
+        migrations.AlterField(
+            model_name='clientplanstatushistory',
+            name='old_status',
+            field=models.PositiveSmallIntegerField(choices=STATUS_CHOICES),
+        ),
+        migrations.AlterField(
+            model_name='clientplanstatushistory',
+            name='new_status',
+            field=models.PositiveSmallIntegerField(choices=STATUS_CHOICES),
+        ),
+        migrations.AddIndex(
+            model_name='clientplan',
+            index=models.Index(fields=['status', 'client'], name='client_plan_status_client_idx'),
+        ),
+        # Also drop the triggers first when unapplying; they are reinstalled
+        # after migrate either way.
+        migrations.RunPython(migrations.RunPython.noop, remove_status_triggers),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_to_meta(apps, schema_editor):
+    ClientPlan = apps.get_model('main', 'ClientPlan')
+    ClientPlanMeta = apps.get_model('main', 'ClientPlanMeta')
+    qn = schema_editor.quote_name
+    columns = ', '.join(qn(c) for c in ('contestability_months', 'months_paid_continuously'))
+    schema_editor.execute(
+        f"INSERT INTO {qn(ClientPlanMeta._meta.db_table)} ({qn('client_plan_id')}, {columns}) "
+        f"SELECT {qn('client_plan_id')}, {columns} FROM {qn(ClientPlan._meta.db_table)}"
+    )
+
+
+def copy_from_meta(apps, schema_editor):
+    ClientPlan = apps.get_model('main', 'ClientPlan')
+    ClientPlanMeta = apps.get_model('main', 'ClientPlanMeta')
+    meta = ClientPlanMeta.objects.filter(client_plan_id=OuterRef('pk'))
+    ClientPlan.objects.filter(meta__isnull=False).update(
+        contestability_months=Subquery(meta.values('contestability_months')[:1]),
+        months_paid_continuously=Subquery(meta.values('months_paid_continuously')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_clientplan_status_smallint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClientPlanMeta',
+            fields=[
+                ('client_plan', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='meta', serialize=False, to='main.clientplan')),
+                ('contestability_months', models.PositiveIntegerField(default=10)),
+                ('months_paid_continuously', models.PositiveIntegerField(default=0)),
+                ('is_contestable', models.GeneratedField(db_persist=True, expression=models.Q(('months_paid_continuously__lt', models.F('contestability_months'))), output_field=models.BooleanField())),
+            ],
+            options={
+                'verbose_name': 'Client Plan Meta',
+                'verbose_name_plural': 'Client Plan Meta',
+                'db_table': 'client_plan_meta',
+            },
+        ),
+        migrations.RunPython(copy_to_meta, copy_from_meta),
+        # The generated column reads the other two, so it has to go first.
+        migrations.RemoveField(
+            model_name='clientplan',
+            name='is_contestable',
+        ),
+        migrations.RemoveField(
+            model_name='clientplan',
+            name='contestability_months',
+        ),
+        migrations.RemoveField(
+            model_name='clientplan',
+            name='months_paid_continuously',
+        ),
+    ]
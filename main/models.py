@@ -1,8 +1,15 @@
 from django.conf import settings
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models import Case, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Cast, Concat, ExtractYear, JSONObject, Now, Round, Substr
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 from decimal import Decimal
+import datetime
+from functools import lru_cache
+from fast_update.query import FastUpdateQuerySet
+import uuid
 
 
 class AuditBase(models.Model):
@@ -27,21 +34,122 @@ class AuditBase(models.Model):
         abstract = True
 
 
+class PersonQuerySet(FastUpdateQuerySet):
+    def rebuild_full_names(self):
+        """
+        Recompute full_name for every row in a single UPDATE, without loading
+        the rows or running save() and its signals.
+        """
+        no_middle_name = Q(middle_name__isnull=True) | Q(middle_name="")
+        return self.update(
+            full_name=Case(
+                When(no_middle_name, then=Concat("first_name", Value(" "), "last_name")),
+                default=Concat("first_name", Value(" "), "middle_name", Value(" "), "last_name"),
+            )
+        )
+
+
+class PersonManager(models.Manager.from_queryset(PersonQuerySet)):
+    def update_full_names(self, objs, batch_size=None):
+        """
+        Persist the name parts of many people together with their rebuilt
+        full_name in one statement per batch, instead of the CASE WHEN
+        UPDATE that bulk_update() generates.
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj.full_name = obj._compute_full_name(obj.first_name, obj.middle_name, obj.last_name)
+        fields = ["first_name", "middle_name", "last_name", "full_name"]
+        if connections[self.db].vendor == "postgresql":
+            size = batch_size or len(objs) or 1
+            return sum(
+                self.get_queryset().copy_update(objs[i:i + size], fields)
+                for i in range(0, len(objs), size)
+            )
+        return self.get_queryset().fast_update(objs, fields, batch_size=batch_size)
+
+
+class AgeQuerySet(PersonQuerySet):
+    def with_age(self):
+        """Annotate each row with its age in whole years, computed by the database."""
+        today = timezone.localdate()
+        had_birthday = Q(birth_date__month__lt=today.month) | Q(
+            birth_date__month=today.month, birth_date__day__lte=today.day
+        )
+        return self.annotate(
+            age=Value(today.year) - ExtractYear("birth_date")
+            - Case(When(had_birthday, then=Value(0)), default=Value(1))
+        )
+
+
+class AgeMixin:
+    # Age is derived from birth_date instead of being stored, so it never goes
+    # stale. It is the current age; the stored column it replaced held the age
+    # at registration, which is age_on(created_at).
+    @property
+    def age(self):
+        if "_age" in self.__dict__:
+            return self._age
+        return self.age_on(timezone.localdate())
+
+    def age_on(self, date):
+        """Age in whole years on the given date."""
+        if self.birth_date is None:
+            return None
+        if isinstance(date, datetime.datetime):
+            date = timezone.localdate(date)
+        return date.year - self.birth_date.year - (
+            (date.month, date.day) < (self.birth_date.month, self.birth_date.day)
+        )
+
+    @age.setter
+    def age(self, value):
+        # Set by AgeQuerySet.with_age()
+        self._age = value
+
+
 class PersonBase(models.Model):
     first_name = models.CharField(max_length=50)
     middle_name = models.CharField(max_length=50, blank=True, null=True)
     last_name = models.CharField(max_length=50)
     full_name = models.CharField(max_length=150, null=False, blank=False)
 
+    objects = PersonManager()
+
+    NAME_FIELDS = frozenset(("first_name", "middle_name", "last_name"))
+
     class Meta:
         abstract = True
 
+    @staticmethod
+    def _compute_full_name(first_name, middle_name, last_name):
+        if middle_name:
+            return f"{first_name} {middle_name} {last_name}"
+        return f"{first_name} {last_name}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the name as loaded so save() can tell if it changed.
+        # Deferred fields are left alone to avoid a query per missing part.
+        loaded = instance.__dict__
+        if cls.NAME_FIELDS.issubset(loaded) and "full_name" in loaded:
+            instance._orig_name = (
+                loaded["first_name"], loaded["middle_name"], loaded["last_name"], loaded["full_name"],
+            )
+        return instance
+
     def save(self, *args, **kwargs):
-        parts = [self.first_name]
-        if self.middle_name:
-            parts.append(self.middle_name)
-        parts.append(self.last_name)
-        self.full_name = " ".join(parts)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or not self.NAME_FIELDS.isdisjoint(update_fields) or "full_name" in update_fields:
+            name = (self.first_name, self.middle_name, self.last_name)
+            # full_name is always derived from the parts; only skip the
+            # rebuild when neither the parts nor full_name itself changed.
+            if not self.full_name or (*name, self.full_name) != getattr(self, "_orig_name", None):
+                self.full_name = self._compute_full_name(*name)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "full_name"}
+            self._orig_name = (*name, self.full_name)
         super().save(*args, **kwargs)
 
 
@@ -49,7 +157,7 @@ class Company(AuditBase):
     company_id = models.AutoField(primary_key=True)
     code = models.CharField(max_length=4, null=True, blank=True, unique=True)
     name = models.CharField(max_length=100, null=False, blank=False, unique=True)
-    address = models.TextField(null=True, blank=True)
+    address = models.CharField(max_length=500, null=True, blank=True)
     contact_number = models.CharField(max_length=100, null=True, blank=True)
     email = models.EmailField(null=True, blank=True)
     contact_person = models.CharField(max_length=100, null=True, blank=True)
@@ -68,7 +176,7 @@ class Branch(AuditBase):
     company = models.ForeignKey(Company, null=False, on_delete=models.CASCADE)
     code = models.CharField(max_length=4, null=True, blank=True, unique=True)
     name = models.CharField(max_length=100, null=False, blank=False, unique=True)
-    address = models.TextField(null=True, blank=True)
+    address = models.CharField(max_length=500, null=True, blank=True)
     contact_number = models.CharField(max_length=100, null=True, blank=True)
     email = models.EmailField(null=True, blank=True)
     contact_person = models.CharField(max_length=100, null=True, blank=True)
@@ -82,11 +190,30 @@ class Branch(AuditBase):
         return f"{self.code} - {self.name}" if self.code else self.name
     
 
+class LookupQuerySet(models.QuerySet):
+    """
+    QuerySet for the small lookup tables cached by their model's get();
+    writes that bypass save() and delete() clear the cache as well.
+    """
+
+    def update(self, **kwargs):
+        updated = super().update(**kwargs)
+        transaction.on_commit(self.model._cached.cache_clear, using=self.db)
+        return updated
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        updated = super().bulk_update(objs, fields, batch_size=batch_size)
+        transaction.on_commit(self.model._cached.cache_clear, using=self.db)
+        return updated
+
+
 class Color(AuditBase):
     color_id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=100, null=False, blank=False, unique=True)
     is_active = models.BooleanField(default=True)
 
+    objects = LookupQuerySet.as_manager()
+
     class Meta:
         db_table = "color"
         verbose_name = "Color"
@@ -94,6 +221,19 @@ class Color(AuditBase):
 
     def __str__(self):
         return self.name
+
+    @classmethod
+    def get(cls, pk):
+        if transaction.get_connection(router.db_for_read(cls)).in_atomic_block:
+            # Rows read inside a transaction may still be rolled back.
+            return cls.objects.get(pk=pk)
+        return cls._cached(pk)
+
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _cached(cls, pk):
+        # Small lookup table; cleared by the signals in main.signals on commit.
+        return cls.objects.get(pk=pk)
     
 
 class Period(models.Model):
@@ -116,7 +256,9 @@ class Period(models.Model):
 
     name = models.CharField(max_length=50, unique=True)  # e.g., 'Monthly', 'Annual', 'Lump Sum'
     is_active = models.BooleanField(default=True)
-    description = models.TextField(null=True, blank=True)
+    description = models.CharField(max_length=500, null=True, blank=True)
+
+    objects = LookupQuerySet.as_manager()
 
     class Meta:
         db_table = "period"
@@ -126,6 +268,19 @@ class Period(models.Model):
 
     def __str__(self):
         return self.name
+
+    @classmethod
+    def get(cls, pk):
+        if transaction.get_connection(router.db_for_read(cls)).in_atomic_block:
+            # Rows read inside a transaction may still be rolled back.
+            return cls.objects.get(pk=pk)
+        return cls._cached(pk)
+
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _cached(cls, pk):
+        # Fixed set of rows; cleared by the signals in main.signals on commit.
+        return cls.objects.get(pk=pk)
     
 
 class GeneralSettings(AuditBase):
@@ -166,7 +321,7 @@ class Personnel(PersonBase, AuditBase):
     company_name = models.CharField(max_length=150, null=True, blank=True)
     contact_number = models.CharField(max_length=100, null=True, blank=True)
     email = models.EmailField(null=True, blank=True)
-    address = models.TextField()
+    address = models.CharField(max_length=500)
     is_agent = models.BooleanField(default=False)
     is_collector = models.BooleanField(default=False)
     is_employee = models.BooleanField(default=False) 
@@ -180,28 +335,120 @@ class Personnel(PersonBase, AuditBase):
         blank=True,               
         related_name='children' 
     )
+    # Materialized path of personnel ids from the root down, e.g. "/1/5/12/",
+    # so a whole subtree can be fetched with one indexed prefix scan.
+    path = models.CharField(max_length=255, blank=True, editable=False, db_index=True)
 
     class Meta:
         db_table = "personnel"
         verbose_name = "Personnel"
         verbose_name_plural = "Personnel"
+        indexes = [
+            models.Index(fields=['is_active'], condition=Q(is_active=True), name='personnel_active_idx'),
+            models.Index(fields=['is_agent'], condition=Q(is_agent=True), name='personnel_agent_idx'),
+            models.Index(fields=['is_collector'], condition=Q(is_collector=True), name='personnel_collector_idx'),
+            models.Index(fields=['full_name'], name='personnel_full_name_idx'),
+        ]
 
     def __str__(self):
         # Assuming full_name comes from your PersonBase model
         return self.full_name
 
+    def clean(self):
+        if self.pk and self.parent_personnel_id:
+            parent_path = Personnel.objects.filter(pk=self.parent_personnel_id).values_list("path", flat=True).first()
+            if parent_path and f"/{self.pk}/" in parent_path:
+                raise ValidationError("Personnel cannot report to themselves or to one of their own subordinates.")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._orig_parent_personnel_id = instance.__dict__.get("parent_personnel_id")
+        return instance
+
+    def save(self, *args, **kwargs):
+        if kwargs.get("update_fields") is None and not self._state.adding:
+            # path is only written by _update_path(); don't write back a copy
+            # that moving an ancestor may have made stale.
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name != "path" and f.attname not in deferred
+            ]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {"parent_personnel", "parent_personnel_id"} & set(update_fields):
+            super().save(*args, **kwargs)
+            return
+        if self.path and self.parent_personnel_id == getattr(self, "_orig_parent_personnel_id", None):
+            super().save(*args, **kwargs)
+        else:
+            # _update_path() rejects cycles after the row is written, so
+            # roll the write back with it.
+            using = kwargs.get("using") or router.db_for_write(self.__class__, instance=self)
+            with transaction.atomic(using=using):
+                super().save(*args, **kwargs)
+                self._update_path()
+        self._orig_parent_personnel_id = self.parent_personnel_id
+
+    def _update_path(self, _descendants=()):
+        parent_path = "/"
+        if self.parent_personnel_id:
+            parent = Personnel.objects.only("path", "parent_personnel").get(pk=self.parent_personnel_id)
+            cycle = ValidationError("Personnel cannot report to themselves or to one of their own subordinates.")
+            if parent.pk == self.pk or parent.pk in _descendants:
+                raise cycle
+            if not parent.path:
+                # The parent was inserted without save() (e.g. bulk_create).
+                parent._update_path((*_descendants, self.pk))
+            parent_path = parent.path
+            if f"/{self.pk}/" in parent_path:
+                raise cycle
+        path = f"{parent_path}{self.pk}/"
+        if path == self.path:
+            return
+        old_path = self.path
+        Personnel.objects.filter(pk=self.pk).update(path=path)
+        if old_path:
+            # Moved: re-root the whole subtree in one statement.
+            Personnel.objects.filter(path__startswith=old_path).exclude(pk=self.pk).update(
+                path=Concat(Value(path), Substr("path", len(old_path) + 1))
+            )
+        self.path = path
+
+    def get_ancestors(self):
+        if not self.path:
+            # Inserted without save(), so the path was never built.
+            return Personnel.objects.none()
+        ids = [int(pk) for pk in self.path.strip("/").split("/")[:-1]]
+        return Personnel.objects.filter(pk__in=ids)
+
+    def get_descendants(self):
+        if not self.path:
+            # A prefix of "" would match every row.
+            return Personnel.objects.none()
+        return Personnel.objects.filter(path__startswith=self.path).exclude(pk=self.pk)
+
+
+class PlanQuerySet(models.QuerySet):
+    def recompute_commissions(self):
+        """Set commission = contract_price * rate for every plan in one UPDATE."""
+        return self.update(commission=Round(F("contract_price") * F("rate"), 2))
+
 
 class Plan(AuditBase):
     plan_id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=150, null=False, blank=False, unique=True)
-    description = models.TextField(null=True, blank=True)
-    contract_price = models.FloatField(null=False, blank=False, default=0.00)
-    rate = models.FloatField(null=False, blank=False, default=0.00)
-    production = models.FloatField(null=False, blank=False, default=0.00)
-    commission = models.FloatField(null=False, blank=False, default=0.00)
-    allowance = models.FloatField(null=False, blank=False, default=0.00)
+    description = models.CharField(max_length=500, null=True, blank=True)
+    contract_price = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
+    # A ratio rather than an amount, so it keeps more precision than the money fields.
+    rate = models.DecimalField(max_digits=9, decimal_places=4, default=Decimal("0.0000"))
+    production = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
+    commission = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
+    allowance = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
     is_active = models.BooleanField(default=True)
 
+    objects = PlanQuerySet.as_manager()
+
     class Meta:
         db_table = "plan"
         verbose_name = "Plan"
@@ -211,12 +458,20 @@ class Plan(AuditBase):
         return self.name
     
 
+class PlanPaymentQuerySet(models.QuerySet):
+    def for_display(self):
+        """Join the plan that PlanPayment.__str__ reads."""
+        return self.select_related("plan")
+
+
 class PlanPayment(AuditBase):
     payment_id = models.AutoField(primary_key=True)
     plan = models.ForeignKey(Plan, on_delete=models.CASCADE, related_name="payments")
     period = models.ForeignKey(Period, on_delete=models.CASCADE, related_name="plan_payments")
     amount = models.DecimalField(max_digits=12, decimal_places=2)  # store payment amount
 
+    objects = PlanPaymentQuerySet.as_manager()
+
     class Meta:
         db_table = "plan_payment"
         verbose_name = "Plan Payment"
@@ -224,14 +479,32 @@ class PlanPayment(AuditBase):
         unique_together = ('plan', 'period')  # prevent duplicate entries
 
     def __str__(self):
-        return f"{self.plan.name} - {self.period.name}: {self.amount}"
+        return f"{self.plan.name} - {Period.get(self.period_id).name}: {self.amount}"
     
 
-class Client(PersonBase, AuditBase):
+class ClientQuerySet(AgeQuerySet):
+    def rebuild_full_names(self):
+        # The filter on self may no longer match after the update, so
+        # collect the clients first and resync only their plans.
+        pks = list(self.values_list("pk", flat=True))
+        updated = super().rebuild_full_names()
+        ClientPlan.objects.filter(client_id__in=pks).sync_client_full_names()
+        return updated
+
+
+class ClientManager(PersonManager.from_queryset(ClientQuerySet)):
+    def update_full_names(self, objs, batch_size=None):
+        objs = list(objs)
+        updated = super().update_full_names(objs, batch_size=batch_size)
+        ClientPlan.objects.filter(client__in=objs).sync_client_full_names()
+        return updated
+
+
+class Client(AgeMixin, PersonBase, AuditBase):
     client_id = models.AutoField(primary_key=True)
     code = models.CharField(max_length=50, null=True, blank=True)
     birth_date = models.DateField(null=False, blank=False)
-    address = models.TextField()
+    address = models.CharField(max_length=500)
     
     gender = models.CharField(
         max_length=1,
@@ -257,35 +530,153 @@ class Client(PersonBase, AuditBase):
     )
     occupation = models.CharField(max_length=100, null=True, blank=True)
     citizenship = models.CharField(max_length=100, null=True, blank=True)
-    
-    age = models.IntegerField(null=True, blank=True)
-
-   
 
     is_active = models.BooleanField(default=True)
 
+    objects = ClientManager()
+
     class Meta:
         db_table = "client"
         verbose_name = "Client"
         verbose_name_plural = "Clients"
+        indexes = [
+            models.Index(fields=['is_active'], condition=Q(is_active=True), name='client_active_idx'),
+        ]
 
     def __str__(self):
         return self.full_name
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        previous_full_name = self.full_name
+        super().save(*args, **kwargs)
+        # Keep the copy of the name stored on the client's plans in sync.
+        if not adding and self.full_name != previous_full_name:
+            ClientPlan.objects.filter(client_id=self.pk).update(client_full_name=self.full_name)
     
 
-class ClientPlanStatus(models.TextChoices):
-    ACTIVE = "active", "Active"
-    LAPSED = "lapsed", "Lapsed"
-    REINSTATED = "reinstated", "Reinstated"
-    TRANSFERRED = "transferred", "Transferred"
-    ASSIGNED = "assigned", "Assigned"
-    CANCELLED = "cancelled", "Cancelled"
-    COMPLETED = "completed", "Completed"
+class ClientPlanStatus(models.IntegerChoices):
+    ACTIVE = 1, "Active"
+    LAPSED = 2, "Lapsed"
+    REINSTATED = 3, "Reinstated"
+    TRANSFERRED = 4, "Transferred"
+    ASSIGNED = 5, "Assigned"
+    CANCELLED = 6, "Cancelled"
+    COMPLETED = 7, "Completed"
+
+
+class JSONArrayAgg(models.Aggregate):
+    # JSON_ARRAYAGG on MySQL/MariaDB, with the SQLite and PostgreSQL spellings below.
+    function = "JSON_ARRAYAGG"
+    output_field = models.JSONField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function="JSON_GROUP_ARRAY", **extra_context)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function="JSONB_AGG", **extra_context)
+
+
+class ClientPlanQuerySet(models.QuerySet):
+    def for_display(self):
+        """Only the columns ClientPlan.__str__ needs, e.g. for choice lists."""
+        return self.select_related("plan").only("contract_no", "client_full_name", "plan__name")
+
+    def with_related(self):
+        """
+        Everything a full client plan representation touches, loaded up front:
+        the single-valued relations joined, beneficiaries in one extra query.
+        """
+        return self.select_related(
+            "client", "plan", "period", "color", "branch", "agent", "collector", "meta"
+        ).prefetch_related("beneficiaries")
+
+    def sync_client_full_names(self):
+        """Copy Client.full_name onto plans whose client_full_name is out of date."""
+        return self.exclude(client_full_name=F("client__full_name")).update(
+            client_full_name=Subquery(
+                Client.objects.filter(pk=OuterRef("client_id")).values("full_name")[:1]
+            )
+        )
+
+    def with_beneficiaries_json(self):
+        """
+        Annotate each plan with its active beneficiaries as a list of dicts
+        (beneficiaries_json), built by the database in the same query.
+        It is None for plans without active beneficiaries. The shape is the
+        same on every backend: birth_date is an ISO date string and
+        is_primary is 0 or 1 (SQLite and MySQL have no JSON booleans for
+        boolean columns). The order of the list is unspecified.
+        """
+        beneficiaries = (
+            ClientBeneficiary.objects.filter(client_plan=OuterRef("pk"), is_active=True)
+            .order_by()
+            .values("client_plan")
+            .annotate(
+                data=JSONArrayAgg(
+                    JSONObject(
+                        client_beneficiary_id="pk",
+                        first_name="first_name",
+                        middle_name="middle_name",
+                        last_name="last_name",
+                        full_name="full_name",
+                        birth_date="birth_date",
+                        gender="gender",
+                        is_primary=Cast("is_primary", models.IntegerField()),
+                    )
+                )
+            )
+            .values("data")
+        )
+        return self.annotate(beneficiaries_json=Subquery(beneficiaries, output_field=models.JSONField()))
+
+
+class ClientPlanManager(models.Manager.from_queryset(ClientPlanQuerySet)):
+    def bulk_create_with_contract_nos(self, rows, batch_size=None):
+        """
+        Bulk insert client plans, assigning a contract number to any row
+        that does not have one yet so the whole set can go in batches.
+        """
+        rows = list(rows)
+        if batch_size is None:
+            # PostgreSQL peaks around 1,000 rows per INSERT, MySQL/MariaDB
+            # keep improving up to ~10,000.
+            batch_size = 1000 if connections[self.db].vendor == "postgresql" else 10_000
+        for row in rows:
+            if not row.contract_no:
+                row.contract_no = uuid.uuid4().hex.upper()
+        # bulk_create() skips save(), so fill in the client names here with one query.
+        missing = {row.client_id for row in rows if not row.client_full_name}
+        if missing:
+            names = dict(Client.objects.filter(pk__in=missing).values_list("pk", "full_name"))
+            for row in rows:
+                if not row.client_full_name:
+                    row.client_full_name = names[row.client_id]
+        with transaction.atomic(using=self.db, savepoint=False):
+            created = self.bulk_create(rows, batch_size=batch_size, ignore_conflicts=False)
+            # Backends that cannot return ids from a bulk insert (MySQL) need them
+            # looked up before the companion meta rows can be created.
+            if any(row.pk is None for row in created):
+                pks = {}
+                for start in range(0, len(created), batch_size):
+                    contract_nos = [row.contract_no for row in created[start:start + batch_size]]
+                    pks.update(
+                        ClientPlan.objects.using(self.db)
+                        .filter(contract_no__in=contract_nos)
+                        .values_list("contract_no", "pk")
+                    )
+                for row in created:
+                    row.pk = pks[row.contract_no]
+            ClientPlanMeta.objects.using(self.db).bulk_create(
+                [ClientPlanMeta(client_plan_id=row.pk) for row in created], batch_size=batch_size
+            )
+        return created
 
 
 class ClientPlan(AuditBase):
     client_plan_id = models.AutoField(primary_key=True)
     client = models.ForeignKey(Client, null=False, on_delete=models.CASCADE)
+    client_full_name = models.CharField(max_length=150, blank=True, editable=False)
     plan = models.ForeignKey(Plan, null=False, default=1, on_delete=models.PROTECT)
     agent = models.ForeignKey(Personnel, null=True, blank=True, on_delete=models.SET_NULL, related_name="client_plans_as_agent", limit_choices_to={"is_agent": True})
     collector = models.ForeignKey(Personnel, null=True, blank=True, on_delete=models.SET_NULL, related_name="client_plans_as_collector", limit_choices_to={"is_collector": True})
@@ -295,22 +686,91 @@ class ClientPlan(AuditBase):
     application_date = models.DateField(null=False, blank=False)
     effective_date = models.DateField(null=False, blank=False)
     period = models.ForeignKey(Period, null=False, default=1, on_delete=models.CASCADE)
-    status = models.CharField(max_length=20, choices=ClientPlanStatus.choices, default=ClientPlanStatus.ACTIVE)
+    status = models.PositiveSmallIntegerField(choices=ClientPlanStatus.choices, default=ClientPlanStatus.ACTIVE)
     total_paid = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
     balance = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
-    contestability_months = models.PositiveIntegerField(default=10)
-    months_paid_continuously = models.PositiveIntegerField(default=0)
-    
+
+    objects = ClientPlanManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'client'], name='client_plan_status_client_idx'),
+        ]
+
     def __str__(self):
-        return f"{self.contract_no} = {self.client.full_name} ({self.plan.name})"
-    
+        return f"{self.contract_no} = {self.client_full_name} ({self.plan.name})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._orig_client_id = instance.__dict__.get("client_id")
+        return instance
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"client", "client_id"} & set(update_fields):
+            if not self.client_full_name or self.client_id != getattr(self, "_orig_client_id", None):
+                self.client_full_name = self.client.full_name
+                if update_fields is not None:
+                    kwargs["update_fields"] = {*update_fields, "client_full_name"}
+            self._orig_client_id = self.client_id
+        if not adding:
+            super().save(*args, **kwargs)
+            return
+        using = kwargs.get("using") or router.db_for_write(self.__class__, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+            ClientPlanMeta.objects.using(using).create(client_plan=self)
+
     @property
     def is_contestable(self):
-        return self.months_paid_continuously < self.contestability_months
+        try:
+            return self.meta.is_contestable
+        except ClientPlanMeta.DoesNotExist:
+            # Plans inserted without save() (bulk_create, loaddata, raw SQL)
+            # have no meta row; use the values it would be created with.
+            fields = ClientPlanMeta._meta
+            return (
+                fields.get_field("months_paid_continuously").default
+                < fields.get_field("contestability_months").default
+            )
+
+
+class ClientPlanMeta(models.Model):
+    # Rarely read client plan details, kept out of the client plan row so
+    # status and balance queries scan fewer pages.
+    client_plan = models.OneToOneField(ClientPlan, primary_key=True, on_delete=models.CASCADE, related_name="meta")
+    contestability_months = models.PositiveIntegerField(default=10)
+    months_paid_continuously = models.PositiveIntegerField(default=0)
+    is_contestable = models.GeneratedField(
+        expression=Q(months_paid_continuously__lt=F("contestability_months")),
+        output_field=models.BooleanField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        db_table = "client_plan_meta"
+        verbose_name = "Client Plan Meta"
+        verbose_name_plural = "Client Plan Meta"
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding:
+            # is_contestable is computed by the database; drop the stale value
+            # so it is reloaded on next access.
+            self.__dict__.pop("is_contestable", None)
+
+
+
+class ClientBeneficiaryQuerySet(AgeQuerySet):
+    def for_display(self):
+        """Join the client plan that ClientBeneficiary.__str__ reads."""
+        return self.select_related("client_plan")
 
-    
 
-class ClientBeneficiary(PersonBase, AuditBase):
+class ClientBeneficiary(AgeMixin, PersonBase, AuditBase):
     client_beneficiary_id = models.AutoField(primary_key=True)
 
     client_plan = models.ForeignKey(
@@ -329,15 +789,11 @@ class ClientBeneficiary(PersonBase, AuditBase):
         help_text="Gender"
     )
 
-    age = models.IntegerField(
-        null=True,
-        blank=True,
-        help_text="Age of the beneficiary at the time of registration (calculated via JavaScript)."
-    )
-
     is_primary = models.BooleanField(default=True)
     is_active = models.BooleanField(default=True)
 
+    objects = PersonManager.from_queryset(ClientBeneficiaryQuerySet)()
+
     class Meta:
         db_table = "client_beneficiary"
         verbose_name = "Client Beneficiary"
@@ -346,50 +802,67 @@ class ClientBeneficiary(PersonBase, AuditBase):
             models.UniqueConstraint(
                 fields=['client_plan', 'is_primary', 'is_active'],
                 condition=models.Q(is_primary=True, is_active=True),
-                name='unique_active_primary_per_client_plan'
+                name='unique_active_primary_per_client_plan',
+                violation_error_message="There can only be one active primary beneficiary for a Client Plan."
             )
         ]
+        indexes = [
+            models.Index(
+                fields=['client_plan', 'is_active', 'is_primary'],
+                name='client_benef_plan_active_idx'
+            ),
+            models.Index(fields=['is_active'], condition=Q(is_active=True), name='client_benef_active_idx'),
+        ]
 
     def clean(self):
-        # Run only when saving an active record
-        if self.is_active:
-            # Count other active beneficiaries for this plan (excluding self when updating)
-            existing_active = ClientBeneficiary.objects.filter(
-                client_plan=self.client_plan,
-                is_active=True
-            ).exclude(pk=self.pk)
-
-            if existing_active.count() >= 2:
-                raise ValidationError("A Client Plan can only have a maximum of 2 active beneficiaries.")
-
-        # Optional: Warn if trying to mark two as primary
-        if self.is_active and self.is_primary:
-            existing_primary = ClientBeneficiary.objects.filter(
-                client_plan=self.client_plan,
-                is_primary=True,
-                is_active=True
-            ).exclude(pk=self.pk)
-
-            if existing_primary.exists():
-                raise ValidationError("There can only be one active primary beneficiary for a Client Plan.")
+        # One active primary per plan is enforced by the
+        # unique_active_primary_per_client_plan constraint (checked by
+        # validate_constraints() during full_clean() and by the database on
+        # save). Only the beneficiary limit needs a query here.
+        if not self.is_active:
+            return
+
+        # Count other active beneficiaries for this plan (excluding self when updating)
+        existing_active = ClientBeneficiary.objects.filter(
+            client_plan=self.client_plan,
+            is_active=True
+        ).exclude(pk=self.pk)
+
+        if existing_active.count() >= 2:
+            raise ValidationError("A Client Plan can only have a maximum of 2 active beneficiaries.")
 
     def __str__(self):
-        return f"{self.first_name} {self.last_name} (Beneficiary of {self.client_plan.client.full_name})"
+        return f"{self.first_name} {self.last_name} (Beneficiary of {self.client_plan.client_full_name})"
     
 
+class ClientPlanStatusHistory(models.Model):
+    # Rows are written by database triggers (see main.triggers), so status
+    # changes made through QuerySet.update() or raw SQL are recorded too.
+    client_plan = models.ForeignKey(ClientPlan, on_delete=models.CASCADE, related_name="status_history")
+    old_status = models.PositiveSmallIntegerField(choices=ClientPlanStatus.choices)
+    new_status = models.PositiveSmallIntegerField(choices=ClientPlanStatus.choices)
+    changed_at = models.DateTimeField(db_default=Now())
+
+    class Meta:
+        db_table = "client_plan_status_history"
+        verbose_name = "Client Plan Status History"
+        verbose_name_plural = "Client Plan Status History"
+        ordering = ['changed_at']
+
+
 class ClientPlanReinstatement(models.Model):
     client_plan = models.ForeignKey(ClientPlan, on_delete=models.CASCADE, related_name="reinstatements")
     reinstatement_date = models.DateField()
     previous_effective_date = models.DateField()
     new_effective_date = models.DateField()
-    remarks = models.TextField(blank=True, null=True)
+    remarks = models.CharField(max_length=500, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
 
 class ClientPlanLapse(models.Model):
     client_plan = models.ForeignKey(ClientPlan, on_delete=models.CASCADE, related_name="lapses")
     lapse_date = models.DateField()
-    reason = models.TextField(blank=True, null=True)
+    reason = models.CharField(max_length=500, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
 
@@ -397,7 +870,7 @@ class ClientPlanTransfer(models.Model):
     from_client_plan = models.ForeignKey(ClientPlan, on_delete=models.CASCADE, related_name="transfers_made")
     to_client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="transferred_plans")
     transfer_date = models.DateField()
-    reason = models.TextField(blank=True, null=True)
+    reason = models.CharField(max_length=500, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
 
@@ -0,0 +1,31 @@
+from django.db import connections, transaction
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .models import Color, Period, Personnel
+from .triggers import install_triggers
+
+
+@receiver([post_save, post_delete], sender=Period)
+@receiver([post_save, post_delete], sender=Color)
+def clear_lookup_cache(sender, using, **kwargs):
+    # Other requests may still read the old row until the change commits.
+    transaction.on_commit(sender._cached.cache_clear, using=using)
+
+
+@receiver(post_delete, sender=Personnel)
+def reroot_orphaned_personnel(sender, instance, **kwargs):
+    # parent_personnel is SET_NULL, so the subtree under a deleted node
+    # becomes its own set of roots.
+    if instance.path:
+        sender.objects.filter(path__startswith=instance.path).update(
+            path=Concat(Value("/"), Substr("path", len(instance.path) + 1))
+        )
+
+
+@receiver(post_migrate)
+def create_history_triggers(sender, using, **kwargs):
+    if sender.name == "main":
+        install_triggers(connections[using])
@@ -1,3 +1,446 @@
-from django.test import TestCase
+import datetime
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.contrib import admin
+from django.test import RequestFactory, TestCase, TransactionTestCase
+
+from .models import (
+    Branch, Client, ClientBeneficiary, ClientPlan, ClientPlanMeta, ClientPlanStatus, Color, Company, Period, Personnel, Plan,
+    PlanPayment,
+)
+
+
+class PersonFullNameTests(TestCase):
+    def test_full_name_built_on_create(self):
+        person = Personnel.objects.create(first_name="Ana", middle_name="B", last_name="Cruz", address="x")
+        self.assertEqual(person.full_name, "Ana B Cruz")
+
+    def test_full_name_rebuilt_when_parts_change(self):
+        person = Personnel.objects.create(first_name="Ana", last_name="Cruz", address="x")
+        person = Personnel.objects.get(pk=person.pk)
+        person.last_name = "Reyes"
+        person.save()
+        self.assertEqual(Personnel.objects.get(pk=person.pk).full_name, "Ana Reyes")
+
+    def test_full_name_cannot_be_overwritten(self):
+        person = Personnel.objects.create(first_name="Ana", last_name="Cruz", address="x")
+        person = Personnel.objects.get(pk=person.pk)
+        person.full_name = "Wrong Name"
+        person.save()
+        self.assertEqual(Personnel.objects.get(pk=person.pk).full_name, "Ana Cruz")
+
+    def test_update_full_names_persists_parts(self):
+        people = [
+            Personnel.objects.create(first_name="A", last_name="B", address="x"),
+            Personnel.objects.create(first_name="C", last_name="D", address="x"),
+        ]
+        people[0].first_name = "Z"
+        people[1].middle_name = "M"
+        Personnel.objects.update_full_names(people, batch_size=1)
+        self.assertEqual(
+            list(Personnel.objects.order_by("pk").values_list("first_name", "middle_name", "full_name")),
+            [("Z", None, "Z B"), ("C", "M", "C M D")],
+        )
+
+
+class PlanCommissionTests(TestCase):
+    def test_recompute_commissions_uses_full_rate(self):
+        plan = Plan.objects.create(name="Gold", contract_price=Decimal("1000.00"), rate=Decimal("0.125"))
+        Plan.objects.recompute_commissions()
+        plan.refresh_from_db()
+        self.assertEqual(plan.rate, Decimal("0.1250"))
+        self.assertEqual(plan.commission, Decimal("125.00"))
+
+
+class ClientPlanTestMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.plan = Plan.objects.create(name="Gold")
+        cls.color = Color.objects.create(name="Blue")
+        cls.period = Period.objects.create(name="Monthly")
+        cls.customer = Client.objects.create(
+            first_name="Ana", last_name="Cruz", birth_date=datetime.date(1990, 1, 1), address="x"
+        )
+
+    @classmethod
+    def make_client_plan(cls, commit=True, **kwargs):
+        client_plan = ClientPlan(
+            client=kwargs.pop("client", cls.customer),
+            plan=cls.plan,
+            color=cls.color,
+            period=cls.period,
+            branch=None,
+            application_date=datetime.date(2026, 1, 1),
+            effective_date=datetime.date(2026, 1, 1),
+            **kwargs,
+        )
+        if commit:
+            client_plan.save()
+        return client_plan
+
+
+class ClientFullNameSyncTests(ClientPlanTestMixin, TestCase):
+    def assertPlanName(self, client_plan, full_name):
+        self.assertEqual(ClientPlan.objects.get(pk=client_plan.pk).client_full_name, full_name)
+
+    def test_copied_on_create(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        self.assertPlanName(client_plan, "Ana Cruz")
+
+    def test_synced_on_client_rename(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        client = Client.objects.get(pk=self.customer.pk)
+        client.last_name = "Reyes"
+        client.save()
+        self.assertPlanName(client_plan, "Ana Reyes")
+
+    def test_synced_on_client_change(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        other = Client.objects.create(
+            first_name="Ben", last_name="Santos", birth_date=datetime.date(1990, 1, 1), address="x"
+        )
+        client_plan = ClientPlan.objects.get(pk=client_plan.pk)
+        client_plan.client = other
+        client_plan.save()
+        self.assertPlanName(client_plan, "Ben Santos")
+
+    def test_synced_by_update_full_names(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        client = Client.objects.get(pk=self.customer.pk)
+        client.first_name = "Anna"
+        Client.objects.update_full_names([client])
+        self.assertPlanName(client_plan, "Anna Cruz")
+
+    def test_synced_by_rebuild_full_names(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        Client.objects.filter(pk=self.customer.pk).update(middle_name="B")
+        Client.objects.filter(pk=self.customer.pk).rebuild_full_names()
+        self.assertPlanName(client_plan, "Ana B Cruz")
+
+    def test_rebuild_full_names_only_syncs_its_clients(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        other = Client.objects.create(
+            first_name="Ben", last_name="Santos", birth_date=datetime.date(1990, 1, 1), address="x"
+        )
+        other_plan = self.make_client_plan(contract_no="C-2", client=other)
+        ClientPlan.objects.filter(pk=other_plan.pk).update(client_full_name="Stale")
+        Client.objects.filter(pk=self.customer.pk).update(middle_name="B")
+        Client.objects.filter(pk=self.customer.pk).rebuild_full_names()
+        self.assertPlanName(client_plan, "Ana B Cruz")
+        self.assertPlanName(other_plan, "Stale")
+
+    def test_filled_by_bulk_create_with_contract_nos(self):
+        (client_plan,) = ClientPlan.objects.bulk_create_with_contract_nos([self.make_client_plan(commit=False)])
+        self.assertTrue(client_plan.contract_no)
+        self.assertPlanName(client_plan, "Ana Cruz")
+
+
+class ClientPlanStatusHistoryTests(ClientPlanTestMixin, TestCase):
+    def history(self, client_plan):
+        return list(client_plan.status_history.values_list("old_status", "new_status"))
+
+    def test_recorded_on_save(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        client_plan.status = ClientPlanStatus.LAPSED
+        client_plan.save()
+        self.assertEqual(self.history(client_plan), [(ClientPlanStatus.ACTIVE, ClientPlanStatus.LAPSED)])
+
+    def test_recorded_on_queryset_update(self):
+        plans = [self.make_client_plan(contract_no=f"C-{i}") for i in range(2)]
+        ClientPlan.objects.update(status=ClientPlanStatus.CANCELLED)
+        for client_plan in plans:
+            self.assertEqual(self.history(client_plan), [(ClientPlanStatus.ACTIVE, ClientPlanStatus.CANCELLED)])
+
+    def test_not_recorded_without_status_change(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        ClientPlan.objects.update(status=ClientPlanStatus.ACTIVE, balance=Decimal("10.00"))
+        self.assertEqual(self.history(client_plan), [])
+
+
+class PersonnelPathTests(TestCase):
+    def make(self, name, parent=None):
+        return Personnel.objects.create(first_name=name, last_name="X", address="x", parent_personnel=parent)
+
+    def path(self, person):
+        return Personnel.objects.get(pk=person.pk).path
+
+    def test_path_on_create(self):
+        root = self.make("Root")
+        child = self.make("Child", root)
+        self.assertEqual(root.path, f"/{root.pk}/")
+        self.assertEqual(self.path(child), f"/{root.pk}/{child.pk}/")
+        self.assertQuerySetEqual(child.get_ancestors(), [root])
+        self.assertQuerySetEqual(root.get_descendants(), [child])
+
+    def test_move_reroots_subtree(self):
+        a, b = self.make("A"), self.make("B")
+        child = self.make("Child", a)
+        grandchild = self.make("Grandchild", child)
+        child = Personnel.objects.get(pk=child.pk)
+        child.parent_personnel = b
+        child.save()
+        self.assertEqual(self.path(child), f"/{b.pk}/{child.pk}/")
+        self.assertEqual(self.path(grandchild), f"/{b.pk}/{child.pk}/{grandchild.pk}/")
+        self.assertQuerySetEqual(a.get_descendants(), [])
+
+    def test_save_keeps_path_moved_by_ancestor(self):
+        a, b = self.make("A"), self.make("B")
+        child = self.make("Child", a)
+        grandchild = Personnel.objects.get(pk=self.make("Grandchild", child).pk)
+        child.parent_personnel = b
+        child.save()
+        grandchild.first_name = "Renamed"
+        grandchild.save()
+        self.assertEqual(self.path(grandchild), f"/{b.pk}/{child.pk}/{grandchild.pk}/")
+
+    def test_save_without_move_skips_path_lookup(self):
+        child = Personnel.objects.get(pk=self.make("Child", self.make("Root")).pk)
+        child.first_name = "Renamed"
+        with self.assertNumQueries(1):
+            child.save()
+
+    def test_cycle_rejected(self):
+        a = self.make("A")
+        b = self.make("B", a)
+        a = Personnel.objects.get(pk=a.pk)
+        a.parent_personnel = b
+        with self.assertRaises(ValidationError):
+            a.save()
+        self.assertEqual(
+            list(Personnel.objects.order_by("pk").values_list("parent_personnel", "path")),
+            [(None, f"/{a.pk}/"), (a.pk, f"/{a.pk}/{b.pk}/")],
+        )
+        a.parent_personnel = a
+        with self.assertRaises(ValidationError):
+            a.save()
+
+    def test_cycle_in_bulk_inserted_rows_rejected(self):
+        a, b = Personnel.objects.bulk_create([
+            Personnel(first_name=name, last_name="X", full_name=f"{name} X", address="x") for name in "AB"
+        ])
+        Personnel.objects.filter(pk=a.pk).update(parent_personnel=b)
+        Personnel.objects.filter(pk=b.pk).update(parent_personnel=a)
+        with self.assertRaises(ValidationError):
+            self.make("C", a)
+
+    def test_delete_reroots_children(self):
+        root = self.make("Root")
+        child = self.make("Child", root)
+        grandchild = self.make("Grandchild", child)
+        root.delete()
+        self.assertEqual(self.path(child), f"/{child.pk}/")
+        self.assertEqual(self.path(grandchild), f"/{child.pk}/{grandchild.pk}/")
+
+    def test_bulk_inserted_rows(self):
+        other = self.make("Other")
+        (bulk,) = Personnel.objects.bulk_create([Personnel(first_name="Bulk", last_name="X", full_name="Bulk X", address="x")])
+        self.assertEqual(bulk.path, "")
+        self.assertQuerySetEqual(bulk.get_descendants(), [])
+        self.assertQuerySetEqual(bulk.get_ancestors(), [])
+        child = self.make("Child", bulk)
+        self.assertEqual(self.path(bulk), f"/{bulk.pk}/")
+        self.assertEqual(self.path(child), f"/{bulk.pk}/{child.pk}/")
+        self.assertEqual(self.path(other), f"/{other.pk}/")
+
+
+class ClientPlanMetaTests(ClientPlanTestMixin, TestCase):
+    def test_created_on_save(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        self.assertTrue(ClientPlanMeta.objects.filter(client_plan=client_plan).exists())
+        self.assertIs(ClientPlan.objects.get(pk=client_plan.pk).is_contestable, True)
+
+    def test_is_contestable_follows_meta(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        ClientPlanMeta.objects.filter(client_plan=client_plan).update(months_paid_continuously=10)
+        self.assertIs(ClientPlan.objects.get(pk=client_plan.pk).is_contestable, False)
+
+    def test_created_by_bulk_create_with_contract_nos(self):
+        created = ClientPlan.objects.bulk_create_with_contract_nos(
+            [self.make_client_plan(commit=False) for _ in range(3)], batch_size=2
+        )
+        self.assertEqual(
+            set(ClientPlanMeta.objects.values_list("client_plan_id", flat=True)), {row.pk for row in created}
+        )
+        self.assertTrue(all(ClientPlan.objects.get(pk=row.pk).is_contestable for row in created))
+
+    def test_is_contestable_without_meta_row(self):
+        (client_plan,) = ClientPlan.objects.bulk_create([self.make_client_plan(commit=False, contract_no="C-1")])
+        self.assertIs(ClientPlan.objects.get(pk=client_plan.pk).is_contestable, True)
+
+
+class ClientPlanMetaAtomicTests(ClientPlanTestMixin, TransactionTestCase):
+    def setUp(self):
+        self.setUpTestData()
+
+    def test_save_leaves_no_plan_without_meta_row(self):
+        with mock.patch.object(ClientPlanMeta, "save", side_effect=IntegrityError):
+            with self.assertRaises(IntegrityError):
+                self.make_client_plan(contract_no="C-1")
+        self.assertFalse(ClientPlan.objects.exists())
+
+    def test_bulk_create_leaves_no_plan_without_meta_row(self):
+        with mock.patch.object(ClientPlanMeta, "objects") as objects:
+            objects.using.return_value.bulk_create.side_effect = IntegrityError
+            with self.assertRaises(IntegrityError):
+                ClientPlan.objects.bulk_create_with_contract_nos([self.make_client_plan(commit=False)])
+        self.assertFalse(ClientPlan.objects.exists())
+
+
+class DefaultManagerTests(ClientPlanTestMixin, TestCase):
+    def test_only_and_defer(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        ClientBeneficiary.objects.create(
+            client_plan=client_plan, first_name="Ben", last_name="Cruz", birth_date=datetime.date(2000, 1, 1)
+        )
+        PlanPayment.objects.create(plan=self.plan, period=self.period, amount=Decimal("10.00"))
+        self.assertEqual(len(ClientPlan.objects.only("contract_no")), 1)
+        self.assertEqual(len(PlanPayment.objects.only("amount")), 1)
+        self.assertEqual(len(self.plan.payments.only("amount")), 1)
+        self.assertEqual(len(ClientBeneficiary.objects.only("first_name")), 1)
+        self.assertEqual(len(ClientBeneficiary.objects.defer("client_plan")), 1)
+
+    def test_str_with_for_display(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        ClientBeneficiary.objects.create(
+            client_plan=client_plan, first_name="Ben", last_name="Cruz", birth_date=datetime.date(2000, 1, 1)
+        )
+        PlanPayment.objects.create(plan=self.plan, period=self.period, amount=Decimal("10.00"))
+        with self.assertNumQueries(1):
+            self.assertEqual([p.plan.name for p in PlanPayment.objects.for_display()], ["Gold"])
+        with self.assertNumQueries(1):
+            self.assertEqual([str(b) for b in ClientBeneficiary.objects.for_display()], ["Ben Cruz (Beneficiary of Ana Cruz)"])
+
+
+class LookupCacheTests(TransactionTestCase):
+    def setUp(self):
+        Period._cached.cache_clear()
+        self.addCleanup(Period._cached.cache_clear)
+        self.period = Period.objects.create(name="M")
+
+    def test_cached_outside_transactions(self):
+        Period.get(self.period.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(Period.get(self.period.pk).name, "M")
+
+    def test_cleared_on_save(self):
+        Period.get(self.period.pk)
+        self.period.name = "Q"
+        self.period.save()
+        self.assertEqual(Period.get(self.period.pk).name, "Q")
+
+    def test_cleared_on_queryset_update(self):
+        Period.get(self.period.pk)
+        Period.objects.filter(pk=self.period.pk).update(name="Q")
+        self.assertEqual(Period.get(self.period.pk).name, "Q")
+
+    def test_not_cached_inside_transactions(self):
+        with transaction.atomic():
+            Period.objects.filter(pk=self.period.pk).update(name="Uncommitted")
+            self.assertEqual(Period.get(self.period.pk).name, "Uncommitted")
+            transaction.set_rollback(True)
+        self.assertEqual(Period.get(self.period.pk).name, "M")
+
+
+class AgeTests(ClientPlanTestMixin, TestCase):
+    def make_beneficiaries(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        for name, birth_date in (("Before", datetime.date(2000, 6, 15)), ("After", datetime.date(2000, 6, 16))):
+            ClientBeneficiary.objects.create(
+                client_plan=client_plan, first_name=name, last_name="X", birth_date=birth_date, is_primary=False
+            )
+
+    @mock.patch("django.utils.timezone.localdate", return_value=datetime.date(2026, 6, 15))
+    def test_age_property(self, localdate):
+        self.make_beneficiaries()
+        ages = {b.first_name: b.age for b in ClientBeneficiary.objects.all()}
+        self.assertEqual(ages, {"Before": 26, "After": 25})
+
+    @mock.patch("django.utils.timezone.localdate", return_value=datetime.date(2026, 6, 15))
+    def test_with_age_matches_property(self, localdate):
+        self.make_beneficiaries()
+        with self.assertNumQueries(1):
+            ages = {b.first_name: b.age for b in ClientBeneficiary.objects.with_age()}
+        self.assertEqual(ages, {"Before": 26, "After": 25})
+        self.assertEqual(
+            dict(Client.objects.with_age().values_list("first_name", "age")),
+            {"Ana": 36},
+        )
+
+    def test_age_on(self):
+        beneficiary = ClientBeneficiary(birth_date=datetime.date(2000, 6, 15))
+        self.assertEqual(beneficiary.age_on(datetime.date(2010, 6, 14)), 9)
+        self.assertEqual(beneficiary.age_on(datetime.date(2010, 6, 15)), 10)
+        self.assertIsNone(ClientBeneficiary().age_on(datetime.date(2010, 6, 15)))
+
+
+class ClientPlanForDisplayTests(ClientPlanTestMixin, TestCase):
+    def test_str_in_one_query(self):
+        for i in range(3):
+            self.make_client_plan(contract_no=f"C-{i}")
+        with self.assertNumQueries(1):
+            labels = [str(client_plan) for client_plan in ClientPlan.objects.for_display().order_by("contract_no")]
+        self.assertEqual(labels, [f"C-{i} = Ana Cruz (Gold)" for i in range(3)])
+
+    def test_admin_client_plan_choices_in_one_query(self):
+        for i in range(3):
+            self.make_client_plan(contract_no=f"C-{i}")
+        model_admin = admin.site._registry[ClientBeneficiary]
+        request = RequestFactory().get("/")
+        field = model_admin.formfield_for_foreignkey(ClientBeneficiary._meta.get_field("client_plan"), request)
+        with self.assertNumQueries(1):
+            labels = [label for _, label in field.choices]
+        self.assertEqual(labels[1:], [f"C-{i} = Ana Cruz (Gold)" for i in range(3)])
+
+
+class ClientPlanWithRelatedTests(ClientPlanTestMixin, TestCase):
+    def test_full_traversal_in_two_queries(self):
+        branch = Branch.objects.create(company=Company.objects.create(name="Co"), name="Main")
+        agent = Personnel.objects.create(first_name="Ag", last_name="X", address="x", is_agent=True)
+        collector = Personnel.objects.create(first_name="Co", last_name="X", address="x", is_collector=True)
+        for i in range(2):
+            client_plan = self.make_client_plan(contract_no=f"C-{i}", agent=agent, collector=collector)
+            ClientPlan.objects.filter(pk=client_plan.pk).update(branch=branch)
+            ClientBeneficiary.objects.create(
+                client_plan=client_plan, first_name="Ben", last_name="X", birth_date=datetime.date(2000, 1, 1)
+            )
+        with self.assertNumQueries(2):
+            rows = [
+                (
+                    client_plan.client.full_name, client_plan.plan.name, client_plan.period.name,
+                    client_plan.color.name, client_plan.branch.name, client_plan.agent.full_name,
+                    client_plan.collector.full_name, client_plan.is_contestable,
+                    [beneficiary.full_name for beneficiary in client_plan.beneficiaries.all()],
+                )
+                for client_plan in ClientPlan.objects.with_related()
+            ]
+        self.assertEqual(rows, 2 * [("Ana Cruz", "Gold", "Monthly", "Blue", "Main", "Ag X", "Co X", True, ["Ben X"])])
+
+
+class ClientPlanBeneficiariesJSONTests(ClientPlanTestMixin, TestCase):
+    def test_active_beneficiaries(self):
+        client_plan = self.make_client_plan(contract_no="C-1")
+        self.make_client_plan(contract_no="C-2")
+        primary = ClientBeneficiary.objects.create(
+            client_plan=client_plan, first_name="Ben", last_name="X", birth_date=datetime.date(2000, 1, 2)
+        )
+        ClientBeneficiary.objects.create(
+            client_plan=client_plan, first_name="Old", last_name="X", birth_date=datetime.date(2000, 1, 2),
+            is_primary=False, is_active=False,
+        )
+        data = dict(ClientPlan.objects.with_beneficiaries_json().values_list("contract_no", "beneficiaries_json"))
+        self.assertEqual(data, {
+            "C-1": [{
+                "client_beneficiary_id": primary.pk,
+                "first_name": "Ben",
+                "middle_name": None,
+                "last_name": "X",
+                "full_name": "Ben X",
+                "birth_date": "2000-01-02",
+                "gender": "M",
+                "is_primary": 1,
+            }],
+            "C-2": None,
+        })
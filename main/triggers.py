@@ -0,0 +1,113 @@
+"""
+Database triggers that keep ClientPlanStatusHistory up to date.
+
+The triggers live outside of the migrations because SQLite drops them
+whenever a migration rebuilds the client plan table; install_triggers()
+is idempotent and runs after every migrate (see main.signals).
+"""
+
+from django.apps import apps
+
+TRIGGER_NAME = "client_plan_status_history_trg"
+
+
+def _sqlite_statements(plan_table, history_table):
+    return [
+        f"DROP TRIGGER IF EXISTS {TRIGGER_NAME}",
+        f"""
+        CREATE TRIGGER {TRIGGER_NAME}
+        AFTER UPDATE OF status ON {plan_table}
+        FOR EACH ROW WHEN OLD.status <> NEW.status
+        BEGIN
+            INSERT INTO {history_table} (client_plan_id, old_status, new_status)
+            VALUES (NEW.client_plan_id, OLD.status, NEW.status);
+        END
+        """,
+    ]
+
+
+def _mysql_statements(plan_table, history_table):
+    return [
+        f"DROP TRIGGER IF EXISTS {TRIGGER_NAME}",
+        f"""
+        CREATE TRIGGER {TRIGGER_NAME}
+        AFTER UPDATE ON {plan_table}
+        FOR EACH ROW
+            INSERT INTO {history_table} (client_plan_id, old_status, new_status)
+            SELECT NEW.client_plan_id, OLD.status, NEW.status FROM DUAL
+            WHERE NOT (OLD.status <=> NEW.status)
+        """,
+    ]
+
+
+def _postgresql_statements(plan_table, history_table):
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION {TRIGGER_NAME}_fn() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO {history_table} (client_plan_id, old_status, new_status)
+            VALUES (NEW.client_plan_id, OLD.status, NEW.status);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        f"DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON {plan_table}",
+        f"""
+        CREATE TRIGGER {TRIGGER_NAME}
+        AFTER UPDATE OF status ON {plan_table}
+        FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION {TRIGGER_NAME}_fn()
+        """,
+    ]
+
+
+DROP_STATEMENTS = {
+    "sqlite": lambda plan_table: [f"DROP TRIGGER IF EXISTS {TRIGGER_NAME}"],
+    "mysql": lambda plan_table: [f"DROP TRIGGER IF EXISTS {TRIGGER_NAME}"],
+    "postgresql": lambda plan_table: [
+        f"DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON {plan_table}",
+        f"DROP FUNCTION IF EXISTS {TRIGGER_NAME}_fn()",
+    ],
+}
+
+
+STATEMENTS = {
+    "sqlite": _sqlite_statements,
+    "mysql": _mysql_statements,
+    "postgresql": _postgresql_statements,
+}
+
+
+def install_triggers(connection):
+    """
+    (Re)create the status history triggers on the given connection.
+    Returns False when the backend is not supported or the tables do not
+    exist yet. A trigger left behind on the plan table without its history
+    table (e.g. after migrating backwards) is dropped.
+    """
+    if connection.vendor not in STATEMENTS:
+        return False
+    plan_table = apps.get_model("main", "ClientPlan")._meta.db_table
+    history_table = apps.get_model("main", "ClientPlanStatusHistory")._meta.db_table
+    existing = connection.introspection.table_names()
+    if plan_table not in existing:
+        return False
+    if history_table not in existing:
+        drop_triggers(connection, plan_table)
+        return False
+    with connection.cursor() as cursor:
+        for sql in STATEMENTS[connection.vendor](plan_table, history_table):
+            cursor.execute(sql)
+    return True
+
+
+def drop_triggers(connection, plan_table):
+    """
+    Remove the status history triggers, e.g. while a migration rewrites the
+    columns they read. They are put back by install_triggers() after migrate.
+    """
+    if connection.vendor not in DROP_STATEMENTS:
+        return
+    with connection.cursor() as cursor:
+        for sql in DROP_STATEMENTS[connection.vendor](plan_table):
+            cursor.execute(sql)